@@ -0,0 +1,71 @@
+# ----------------------------------------------------
+# danger rating statistics and forecast anomalies computed from cleaned data in data/cleaned
+#
+# author David Hurley
+# email hurleyldave@gmail.com
+# ----------------------------------------------------
+
+import os
+import numpy as np
+import pandas as pd
+from collections import Counter
+from scripts.paths import CLEANED_DATA_DIR, cleaned_filenames
+
+ELEVATIONS = ['alpine', 'treeline', 'belowtree']
+
+# types of problems to search in text based on Simon Fraser document
+AVY_PROBLEM_TYPES = ['storm slab', 'wind slab', 'wet avalanche', 'cornice', 'persistent slab',
+                     'deep persistent', 'wet loose']
+
+def zero_matrix():
+    '''function to create a zero matrix for seaborn heatmap plotting'''
+
+    df = pd.DataFrame(np.zeros((5,5)), index=[5,4,3,2,1])  # reverse for plotting purposes
+    df.columns = [1,2,3,4,5]
+
+    return df
+
+def load_cleaned(region):
+    '''load cleaned current, current+1, and current+2 danger ratings for a region, parse dates as datetime'''
+
+    return [pd.read_csv(os.path.join(CLEANED_DATA_DIR, filename), parse_dates=['date_valid'])
+            for filename in cleaned_filenames(region)]
+
+def danger_rating_occurrence(df_current):
+    '''percent occurence of each danger rating for each elevation'''
+
+    return pd.concat([df_current['{}_status_code'.format(elevation)].value_counts(normalize=True) * 100
+                      for elevation in ELEVATIONS], axis=1, keys=ELEVATIONS).sort_index()
+
+def problem_counts(df_current):
+    '''number of times each avalanche problem type is mentioned in the problem text'''
+
+    count = []
+
+    # loops through reported problems and matches with problem types
+    for problem in df_current.problems:
+        for avy_problem_type in AVY_PROBLEM_TYPES:
+            if avy_problem_type in problem.lower().replace('.',''):
+                count.append(avy_problem_type)
+
+    return pd.DataFrame(Counter(count).most_common()).sort_values(by=[1])
+
+def forecast_anomaly(df_current, df_forecast, elevation):
+    '''percentage of time a forecasted danger rating (columns) matched each day of danger rating (rows)'''
+
+    # merge day of and forecasted datasets
+    df_merged = pd.merge(df_current, df_forecast, left_on='date_valid', right_on='date_valid')
+    day_of = df_merged['{}_status_code_x'.format(elevation)]
+    forecast = df_merged['{}_status_code_y'.format(elevation)]
+
+    df_anomaly = zero_matrix()
+
+    # for each forecasted danger rating check frequency of day of danger rating, ratings never forecasted stay zero
+    for i in [1,2,3,4,5]:
+        n_forecast = (forecast == i).sum()
+        if n_forecast == 0:
+            continue
+        for j in [1,2,3,4,5]:
+            df_anomaly.loc[j, i] = ((day_of == j) & (forecast == i)).sum() / n_forecast * 100
+
+    return df_anomaly
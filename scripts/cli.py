@@ -0,0 +1,210 @@
+# ----------------------------------------------------
+# command line entry point to scrape, clean, ingest, analyze, and render Avalanche Canada data
+#
+# heavy dependencies (pandas, selenium, matplotlib, seaborn) are imported inside the subcommand that needs them
+# so quick commands like status start fast and every command can be run from any directory (i.e. cron)
+#
+# author David Hurley
+# email hurleyldave@gmail.com
+# ----------------------------------------------------
+
+import argparse
+import csv
+import os
+import shutil
+import sys
+from scripts.paths import (RAW_DATA_DIR, CLEANED_DATA_DIR, SCRAPE_INPUTS_PATH, CLEAN_INPUTS_PATH,
+                           CONDITION_PREFIXES, raw_filenames, cleaned_filenames)
+
+RAW_COLUMNS = ['date_valid', 'alpine_status', 'alpine_status_code', 'treeline_status', 'treeline_status_code',
+               'belowtree_status', 'belowtree_status_code']
+
+def regions_on_disk():
+    '''regions with at least one raw or cleaned file, in filename form (i.e. sea_to_sky)'''
+
+    regions = set()
+    for folder, marker, suffix in [(RAW_DATA_DIR, '_avalanche_conditions_', '_RAW.csv'),
+                                   (CLEANED_DATA_DIR, '_avalanche_danger_ratings_', '_CLEANED.csv')]:
+        if not os.path.isdir(folder):
+            continue
+        for filename in os.listdir(folder):
+            if marker in filename and filename.endswith(suffix):
+                regions.add(filename.split(marker, 1)[1][:-len(suffix)])
+
+    return sorted(regions)
+
+def not_found(error):
+    '''report a missing input file on stderr and return a non-zero exit code'''
+
+    print('{}: not found'.format(error.filename), file=sys.stderr)
+
+    return 1
+
+def status(args):
+    '''print which raw and cleaned files exist for each region'''
+
+    regions = [args.region] if args.region else regions_on_disk()
+    for region in regions:
+        raw = [os.path.exists(os.path.join(RAW_DATA_DIR, f)) for f in raw_filenames(region)]
+        cleaned = [os.path.exists(os.path.join(CLEANED_DATA_DIR, f)) for f in cleaned_filenames(region)]
+        print('{}: raw {}/3, cleaned {}/3'.format(region, sum(raw), sum(cleaned)))
+
+    return 0
+
+def scrape(args):
+    '''scrape a region and date range, defaults come from scrape_inputs.json'''
+
+    import json
+    from scripts.scrape_export_data import scrape_export
+
+    try:
+        with open(args.inputs, 'r') as f:
+            inputs = json.load(f)
+    except FileNotFoundError as e:
+        return not_found(e)
+
+    paths = scrape_export(args.region or inputs['region'], args.start_date or inputs['start_date'],
+                          args.end_date or inputs['end_date'], args.show_browser or inputs['show_browser_window'])
+    for path in paths:
+        print(path)
+
+    return 0
+
+def clean(args):
+    '''clean raw data for a region, without a region the inputs in clean_inputs.json are used'''
+
+    from scripts import clean_scraped_data
+
+    try:
+        if args.region:
+            paths = clean_scraped_data.clean(args.region)
+        else:
+            paths = clean_scraped_data.main(args.inputs)
+    except FileNotFoundError as e:
+        return not_found(e)
+    for path in paths:
+        print(path)
+
+    return 0
+
+def ingest(args):
+    '''copy raw csv files scraped elsewhere into data/raw after checking their columns'''
+
+    exit_code = 0
+    for path in args.files:
+        filename = os.path.basename(path)
+        if not filename.endswith('_RAW.csv') or not any(filename.startswith(prefix + '_avalanche_conditions_')
+                                                         for prefix in CONDITION_PREFIXES):
+            print('{}: filename does not match the data/raw naming, skipping'.format(path), file=sys.stderr)
+            exit_code = 1
+            continue
+
+        try:
+            with open(path, newline='') as f:
+                header = next(csv.reader(f), [])
+        except (OSError, UnicodeDecodeError) as e:
+            print('{}: could not read ({}), skipping'.format(path, e), file=sys.stderr)
+            exit_code = 1
+            continue
+        missing = [column for column in RAW_COLUMNS if column not in header]
+        if missing:
+            print('{}: missing columns {}, skipping'.format(path, ', '.join(missing)), file=sys.stderr)
+            exit_code = 1
+            continue
+
+        destination = os.path.join(RAW_DATA_DIR, filename)
+        try:
+            if not (os.path.exists(destination) and os.path.samefile(path, destination)):
+                shutil.copyfile(path, destination)
+        except OSError as e:
+            print('{}: could not copy to {} ({}), skipping'.format(path, destination, e), file=sys.stderr)
+            exit_code = 1
+            continue
+        print(destination)
+
+    return exit_code
+
+def analyze(args):
+    '''print danger rating occurrence, problem types, and forecast anomaly for a region'''
+
+    from scripts.analysis import ELEVATIONS, load_cleaned, danger_rating_occurrence, problem_counts, forecast_anomaly
+
+    try:
+        df_current, df_current_plus1, df_current_plus2 = load_cleaned(args.region)
+    except FileNotFoundError as e:
+        return not_found(e)
+
+    print('Percent Occurrence of Each Danger Rating:\n', danger_rating_occurrence(df_current).round(1), '\n')
+    print('Avalanche Problem Mentions:\n', problem_counts(df_current).to_string(index=False, header=False), '\n')
+    for elevation in ELEVATIONS:
+        for days, df_forecast in [(1, df_current_plus1), (2, df_current_plus2)]:
+            print('{} Forecast Anomaly {}-Day Out (%):\n'.format(elevation.title(), days),
+                  forecast_anomaly(df_current, df_forecast, elevation).round(1), '\n')
+
+    return 0
+
+def render(args):
+    '''save danger rating figures for a region to figures'''
+
+    import matplotlib
+    matplotlib.use('Agg')  # no display is needed to save figures, i.e. when run from cron
+    from scripts.analysis import load_cleaned
+    from scripts import render as render_figures
+
+    try:
+        df_current, df_current_plus1, df_current_plus2 = load_cleaned(args.region)
+    except FileNotFoundError as e:
+        return not_found(e)
+
+    print(render_figures.render_danger_ratings(args.region, df_current))
+    print(render_figures.render_problem_types(args.region, df_current))
+    print(render_figures.render_forecast_anomaly(args.region, df_current, df_current_plus1, df_current_plus2))
+
+    return 0
+
+def build_parser():
+    '''argument parser with a subcommand for each step'''
+
+    parser = argparse.ArgumentParser(prog='avalanche-canada',
+                                     description='scrape, clean, ingest, analyze, and render Avalanche Canada danger ratings')
+    subparsers = parser.add_subparsers(dest='command', metavar='command')
+    subparsers.required = True
+
+    parser_status = subparsers.add_parser('status', help='list raw and cleaned files for each region')
+    parser_status.add_argument('--region', help='only show this region (i.e. sea_to_sky)')
+    parser_status.set_defaults(func=status)
+
+    parser_scrape = subparsers.add_parser('scrape', help='scrape raw data from avalanche.ca to data/raw')
+    parser_scrape.add_argument('--inputs', default=SCRAPE_INPUTS_PATH, help='json file of default inputs')
+    parser_scrape.add_argument('--region', help='avalanche canada region (i.e. sea-to-sky)')
+    parser_scrape.add_argument('--start-date', help='first date to scrape in ISO 8601 format')
+    parser_scrape.add_argument('--end-date', help='last date to scrape in ISO 8601 format')
+    parser_scrape.add_argument('--show-browser', choices=['Yes', 'No'], help='display the web browser while scraping')
+    parser_scrape.set_defaults(func=scrape)
+
+    parser_clean = subparsers.add_parser('clean', help='clean data/raw files to data/cleaned')
+    parser_clean.add_argument('--inputs', default=CLEAN_INPUTS_PATH, help='json file of inputs used without --region')
+    parser_clean.add_argument('--region', help='clean the default raw files of this region (i.e. sea_to_sky)')
+    parser_clean.set_defaults(func=clean)
+
+    parser_ingest = subparsers.add_parser('ingest', help='copy raw csv files into data/raw')
+    parser_ingest.add_argument('files', nargs='+', help='raw csv files named like the files in data/raw')
+    parser_ingest.set_defaults(func=ingest)
+
+    parser_analyze = subparsers.add_parser('analyze', help='print danger rating statistics for a region')
+    parser_analyze.add_argument('region', help='region of the cleaned data (i.e. sea_to_sky)')
+    parser_analyze.set_defaults(func=analyze)
+
+    parser_render = subparsers.add_parser('render', help='save danger rating figures for a region')
+    parser_render.add_argument('region', help='region of the cleaned data (i.e. sea_to_sky)')
+    parser_render.set_defaults(func=render)
+
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    return args.func(args)
+
+if __name__ == '__main__':
+    sys.exit(main())
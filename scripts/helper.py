@@ -7,12 +7,14 @@
 
 import pandas as pd
 import time
-from selenium import webdriver
-from selenium.webdriver.firefox.options import Options
 
 def scrape(dates, region, browser_viz):
     """ Scrape current and forecast conditions and problem text from AvalancheCanada.ca historical page """
 
+    # selenium is imported here so that importing this module does not require a web driver
+    from selenium import webdriver
+    from selenium.webdriver.firefox.options import Options
+
     # empty list for current, current+1, current+2 forecast conditions and text problems
     current_conditions = []
     current_plus_1_conditions = []
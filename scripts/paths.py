@@ -0,0 +1,48 @@
+# ----------------------------------------------------
+# resolves repo folders and data filenames independent of the current working directory
+#
+# author David Hurley
+# email hurleyldave@gmail.com
+# ----------------------------------------------------
+
+import os
+
+# absolute paths to repo folders, relative to this file rather than the working directory
+# set AVALANCHE_CANADA_ROOT to the folder holding data and figures when not installed with pip install -e .
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.abspath(os.path.expanduser(os.environ.get('AVALANCHE_CANADA_ROOT') or os.path.dirname(SCRIPTS_DIR)))
+RAW_DATA_DIR = os.path.join(ROOT_DIR, 'data', 'raw')
+CLEANED_DATA_DIR = os.path.join(ROOT_DIR, 'data', 'cleaned')
+FIGURES_DIR = os.path.join(ROOT_DIR, 'figures')
+
+# default user input files
+SCRAPE_INPUTS_PATH = os.path.join(SCRIPTS_DIR, 'scrape_inputs.json')
+CLEAN_INPUTS_PATH = os.path.join(SCRIPTS_DIR, 'clean_inputs.json')
+
+# prefixes for day of, 1-day out, and 2-day out files
+CONDITION_PREFIXES = ['current', 'current_plus1', 'current_plus2']
+
+def region_slug(region):
+    '''convert an avalanche canada region (i.e. sea-to-sky) to the form used in filenames (i.e. sea_to_sky)'''
+
+    return region.replace('-', '_')
+
+def region_dashed(region):
+    '''convert a region in filename form (i.e. sea_to_sky) to the avalanche canada and figure form (i.e. sea-to-sky)'''
+
+    return region.replace('_', '-')
+
+def region_title(region):
+    '''region name used in figure titles (i.e. Sea to Sky)'''
+
+    return region_dashed(region).replace('-', ' ').title().replace(' To ', ' to ')
+
+def raw_filenames(region):
+    '''raw data filenames for current, current+1, and current+2 conditions of a region'''
+
+    return ['{}_avalanche_conditions_{}_RAW.csv'.format(prefix, region_slug(region)) for prefix in CONDITION_PREFIXES]
+
+def cleaned_filenames(region):
+    '''cleaned data filenames for current, current+1, and current+2 conditions of a region'''
+
+    return ['{}_avalanche_danger_ratings_{}_CLEANED.csv'.format(prefix, region_slug(region)) for prefix in CONDITION_PREFIXES]
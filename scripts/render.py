@@ -0,0 +1,148 @@
+# ----------------------------------------------------
+# renders danger rating figures from cleaned data and saves them to figures
+#
+# author David Hurley
+# email hurleyldave@gmail.com
+# ----------------------------------------------------
+
+import os
+import matplotlib.pyplot as plt
+from matplotlib.patches import Patch
+import numpy as np
+import seaborn as sns
+from scripts.analysis import ELEVATIONS, danger_rating_occurrence, problem_counts, forecast_anomaly
+from scripts.paths import FIGURES_DIR, region_dashed, region_title
+
+# custom colormap for danger ratings 1 through 5
+COLORS = [(82/255, 186/255, 74/255), (255/255, 243/255, 0/255), (247/255, 146/255, 24/255),
+          (239/255, 28/255, 41/255), (0/255, 0/255, 0/255)]
+
+DISCLAIMER = 'This data is not meant to inform avalanche decision making and should not be relied upon'
+
+def figure_label(region, df_current):
+    '''region name and year range used in figure titles, i.e. Sea to Sky Region: 2011-2020'''
+
+    years = df_current.date_valid.dt.year
+
+    return '{} Region: {}-{}'.format(region_title(region), years.min(), years.max())
+
+def figure_slug(region, df_current):
+    '''region and year range used in figure filenames, i.e. sea-to-sky-2011-2020'''
+
+    years = df_current.date_valid.dt.year
+
+    return '{}-{}-{}'.format(region_dashed(region), years.min(), years.max())
+
+def render_danger_ratings(region, df_current):
+    '''donut chart of day of danger ratings at each elevation'''
+
+    avy_perc_occur_all_elev = danger_rating_occurrence(df_current)
+
+    # properties for donut charts
+    status_labels = ['Low', 'Moderate', 'Considerable', 'High', 'Extreme']
+    title_labels = ['Alpine', 'Treeline', 'Belowtree']
+    elevation_names = ['in the alpine', 'at treeline', 'below treeline']
+
+    fig, ax = plt.subplots(3,1,figsize=(7,12), subplot_kw=dict(aspect="equal"), facecolor='white')
+
+    for i, col in enumerate(avy_perc_occur_all_elev):
+
+        data = avy_perc_occur_all_elev[col].dropna()  # remove any NaN rows
+
+        donut_labels = [str(round(y,1)) + '%' for y in list(data)]
+
+        wedges, texts = ax[i].pie(data, wedgeprops=dict(width=0.5), startangle=-40,
+                                  colors=[COLORS[int(code) - 1] for code in data.index])
+
+        #  create lines and labels
+        kw = dict(arrowprops=dict(arrowstyle="-"), zorder=0, va="center")
+
+        for j, p in enumerate(wedges):
+            ang = (p.theta2 - p.theta1)/2. + p.theta1
+            y = np.sin(np.deg2rad(ang))
+            x = np.cos(np.deg2rad(ang))
+            horizontalalignment = {-1: "right", 1: "left"}[int(np.sign(x))]
+            connectionstyle = "angle,angleA=0,angleB={}".format(ang)
+            kw["arrowprops"].update({"connectionstyle": connectionstyle})
+            ax[i].annotate(donut_labels[j], xy=(x, y), xytext=(1.1*np.sign(x), 1.4*y),
+                        horizontalalignment=horizontalalignment, **kw)
+
+        ax[i].text(0,0,title_labels[i], fontsize='14', ha='center', va='center')  # add title to donut center
+
+    ax[0].text(-2,1.2,'Avalanche Danger Ratings \n({})'.format(figure_label(region, df_current)), fontsize='12')
+    legend_handles = [Patch(color=color) for color in COLORS]  # every rating, even if missing at an elevation
+    ax[1].legend(legend_handles, status_labels, title="Danger Rating", loc='center left',
+                 bbox_to_anchor=(-0.7, 0.25, 0.5, 0.5), prop=dict(size=12))
+
+    # note any elevation without extreme days, i.e. below treeline in sea to sky
+    years = df_current.date_valid.dt.year
+    no_extreme = [elevation_names[i] for i, col in enumerate(avy_perc_occur_all_elev)
+                  if not avy_perc_occur_all_elev[col].get(5, 0) > 0]
+    notes = ['*No extreme days {} from {} to {}'.format(' or '.join(no_extreme), years.min(), years.max())] if no_extreme else []
+    ax[2].text(-2, -2.2, '\n\n'.join(notes + [DISCLAIMER.replace(' and ', ' and \n')]), va='top')
+
+    path = os.path.join(FIGURES_DIR, 'avalanche-danger-ratings-{}.png'.format(figure_slug(region, df_current)))
+    fig.savefig(path, bbox_inches='tight')  # keep notes placed outside the axes
+    plt.close(fig)
+
+    return path
+
+def render_problem_types(region, df_current):
+    '''bar chart of the most common avalanche problem types'''
+
+    common_problem_count = problem_counts(df_current)
+
+    fig, ax = plt.subplots(1,1,figsize=(14,5), facecolor="white")
+
+    ax.barh(common_problem_count[0], common_problem_count[1], zorder=3)
+    ax.set_xlabel('Number of Times Mentioned')
+    ax.set_title('Most Common Avalanche Problems ({})'.format(figure_label(region, df_current)))
+    ax.text(0.98, 0.05, '*Based on problem text as written by forecasters. \n This is an estimate and actual counts may differ.',
+            transform=ax.transAxes, ha='right')
+    ax.grid(zorder=0)
+    ax.text(0, -1.7, '*' + DISCLAIMER)
+
+    path = os.path.join(FIGURES_DIR, 'frequency-of-avalanche-problem-types-{}.png'.format(figure_slug(region, df_current)))
+    fig.savefig(path, bbox_inches='tight')  # keep notes placed outside the axes
+    plt.close(fig)
+
+    return path
+
+def render_forecast_anomaly(region, df_current, df_current_plus1, df_current_plus2):
+    '''heatmaps of 1- and 2-day out forecast anomaly at each elevation'''
+
+    # alternate 1- and 2-day out for each elevation
+    df_list = []
+    for elevation in ELEVATIONS:
+        df_list.append(forecast_anomaly(df_current, df_current_plus1, elevation))
+        df_list.append(forecast_anomaly(df_current, df_current_plus2, elevation))
+
+    labels = ['Alpine', '', 'Treeline', '', 'Belowtree', '']
+
+    fig, ax = plt.subplots(3, 2, figsize=(10,14), facecolor="white")
+    ax = ax.flatten()
+
+    for i, df in enumerate(df_list):
+
+        ax[i] = sns.heatmap(df, annot=df, fmt='.3g', cmap='mako_r', cbar=False, square=True, ax=ax[i], vmin=0, vmax=100)
+
+        for t in ax[i].texts:
+            t.set_text(t.get_text() + "%")
+
+        if i % 2 == 0:
+            ax[i].text(-1.3,3,labels[i], rotation=90, fontweight='bold', fontsize='12')
+            ax[i].set_ylabel('Day Of Danger Rating')
+            ax[i].set_xlabel('1-Day Out Forecasted Danger Rating')
+        else:
+            ax[i].set_xlabel('2-Day Out Forecasted Danger Rating')
+
+    ax[0].text(1, -0.3, 'Forecast Danger Rating Anomaly ({})'.format(figure_label(region, df_current)),
+               fontweight='bold', fontsize='12')
+    ax[4].text(0, 7.5, "Percentage a 1- and 2- day forecasted danger rating aligned or differed from a reported \n"
+               "danger rating. " + DISCLAIMER.replace(' and ', ' and \n', 1), fontsize='12')
+
+    path = os.path.join(FIGURES_DIR, 'one-and-two-day-forecast-anomaly-{}.png'.format(figure_slug(region, df_current)))
+    fig.savefig(path, bbox_inches='tight')  # keep notes placed outside the axes
+    plt.close(fig)
+
+    return path
@@ -7,30 +7,45 @@
 # ----------------------------------------------------
 
 import json
+import os
 import pandas as pd
-from helper import scrape
-
-# read user inputs
-with open('scrape_inputs.json', 'r') as f:
-    inputs = json.load(f)
-
-# format list of dates to scrape avy can data for
-dates_to_scrape = pd.date_range(inputs['start_date'], inputs['end_date'])
-months_to_scrape = [1, 2, 3, 4, 11, 12]  # only scrape months when avalanche canada forecasts
-dates_to_scrape = dates_to_scrape[dates_to_scrape.month.isin(months_to_scrape)]
-
-# function to open selenium web driver and scrape avalanche canada data for each specified date
-conditions_today, conditions_today_plus1, conditions_today_plus2, problems = scrape(dates_to_scrape, inputs['region'], inputs['show_browser_window'])
-
-# create dataframe of scraped data for today and future dates
-column_names = ['date_valid', 'alpine_status', 'alpine_status_code', 'treeline_status', 'treeline_status_code',
-            'belowtree_status', 'belowtree_status_code']
-conditions_today = pd.DataFrame(conditions_today, columns=column_names)
-conditions_today['problems'] = pd.DataFrame(problems)
-conditions_today_plus1 = pd.DataFrame(conditions_today_plus1, columns=column_names)
-conditions_today_plus2 = pd.DataFrame(conditions_today_plus2, columns=column_names)
-
-# export scraped data to csv files
-conditions_today.to_csv('../data/raw/current_avalanche_conditions_' + inputs['region'].replace('-', '_') + '_RAW.csv', index=False)
-conditions_today_plus1.to_csv('../data/raw/current_plus1_avalanche_conditions_' + inputs['region'].replace('-', '_') + '_RAW.csv', index=False)
-conditions_today_plus2.to_csv('../data/raw/current_plus2_avalanche_conditions_' + inputs['region'].replace('-', '_') + '_RAW.csv', index=False)
+from scripts.helper import scrape
+from scripts.paths import RAW_DATA_DIR, SCRAPE_INPUTS_PATH, raw_filenames
+
+def scrape_export(region, start_date, end_date, show_browser_window='Yes'):
+    """ Scrape avalanche canada data for a region and date range and save raw csv files to data/raw """
+
+    # format list of dates to scrape avy can data for
+    dates_to_scrape = pd.date_range(start_date, end_date)
+    months_to_scrape = [1, 2, 3, 4, 11, 12]  # only scrape months when avalanche canada forecasts
+    dates_to_scrape = dates_to_scrape[dates_to_scrape.month.isin(months_to_scrape)]
+
+    # function to open selenium web driver and scrape avalanche canada data for each specified date
+    conditions_today, conditions_today_plus1, conditions_today_plus2, problems = scrape(dates_to_scrape, region, show_browser_window)
+
+    # create dataframe of scraped data for today and future dates
+    column_names = ['date_valid', 'alpine_status', 'alpine_status_code', 'treeline_status', 'treeline_status_code',
+                'belowtree_status', 'belowtree_status_code']
+    conditions_today = pd.DataFrame(conditions_today, columns=column_names)
+    conditions_today['problems'] = pd.DataFrame(problems)
+    conditions_today_plus1 = pd.DataFrame(conditions_today_plus1, columns=column_names)
+    conditions_today_plus2 = pd.DataFrame(conditions_today_plus2, columns=column_names)
+
+    # export scraped data to csv files
+    output_paths = [os.path.join(RAW_DATA_DIR, filename) for filename in raw_filenames(region)]
+    for df, path in zip([conditions_today, conditions_today_plus1, conditions_today_plus2], output_paths):
+        df.to_csv(path, index=False)
+
+    return output_paths
+
+def main(inputs_path=SCRAPE_INPUTS_PATH):
+    """ Scrape using the inputs in scrape_inputs.json """
+
+    # read user inputs
+    with open(inputs_path, 'r') as f:
+        inputs = json.load(f)
+
+    return scrape_export(inputs['region'], inputs['start_date'], inputs['end_date'], inputs['show_browser_window'])
+
+if __name__ == '__main__':
+    main()
@@ -1,3 +1,5 @@
 from setuptools import setup, find_packages
 
-setup(name="scripts", packages=find_packages())
\ No newline at end of file
+setup(name="scripts", packages=find_packages(), include_package_data=True,
+      package_data={"scripts": ["*.json"]},
+      entry_points={"console_scripts": ["avalanche-canada=scripts.cli:main"]})
@@ -0,0 +1,26 @@
+import unittest
+import pandas as pd
+from scripts.analysis import forecast_anomaly
+
+class TestForecastAnomaly(unittest.TestCase):
+
+	def test_ratings_never_forecast_stay_zero(self):
+		dates = pd.to_datetime(['2019-12-01', '2019-12-02', '2019-12-03', '2019-12-04'])
+		df_current = pd.DataFrame({'date_valid': dates, 'alpine_status_code': [1, 2, 2, 3]})
+		df_forecast = pd.DataFrame({'date_valid': dates, 'alpine_status_code': [1, 2, 3, 3]})
+
+		df_anomaly = forecast_anomaly(df_current, df_forecast, 'alpine')
+
+		# columns are forecasted ratings, rows are day of ratings
+		self.assertEqual(df_anomaly.loc[1, 1], 100)
+		self.assertEqual(df_anomaly.loc[2, 2], 100)
+		self.assertEqual(df_anomaly.loc[2, 3], 50)
+		self.assertEqual(df_anomaly.loc[3, 3], 50)
+		self.assertEqual(df_anomaly[3].sum(), 100)
+
+		# ratings 4 and 5 were never forecast so their columns are zero rather than NaN
+		self.assertEqual(df_anomaly[4].tolist(), [0] * 5)
+		self.assertEqual(df_anomaly[5].tolist(), [0] * 5)
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,111 @@
+import contextlib
+import io
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+from scripts import cli
+from scripts.paths import RAW_DATA_DIR, CLEANED_DATA_DIR, raw_filenames, cleaned_filenames
+
+RAW_HEADER = 'date_valid,alpine_status,alpine_status_code,treeline_status,treeline_status_code,belowtree_status,belowtree_status_code\n'
+
+class TestCli(unittest.TestCase):
+
+	def test_import_does_not_load_heavy_dependencies(self):
+		code = 'import sys, scripts.cli, scripts.helper; print(sorted(m for m in ["selenium", "matplotlib", "seaborn", "scipy"] if m in sys.modules))'
+		output = subprocess.check_output([sys.executable, '-c', code])
+		self.assertEqual(output.decode().strip(), '[]')
+
+	def test_status_runs_outside_repo(self):
+		with tempfile.TemporaryDirectory() as cwd:
+			output = subprocess.check_output([sys.executable, '-m', 'scripts', 'status', '--region', 'sea_to_sky'], cwd=cwd)
+		self.assertEqual(output.decode().strip(), 'sea_to_sky: raw 3/3, cleaned 3/3')
+
+	def test_clean_region_runs_outside_repo(self):
+		with tempfile.TemporaryDirectory() as root, tempfile.TemporaryDirectory() as cwd:
+			os.makedirs(os.path.join(root, 'data', 'raw'))
+			os.makedirs(os.path.join(root, 'data', 'cleaned'))
+			for filename in raw_filenames('sea_to_sky'):
+				shutil.copyfile(os.path.join(RAW_DATA_DIR, filename), os.path.join(root, 'data', 'raw', filename))
+
+			env = dict(os.environ, AVALANCHE_CANADA_ROOT=root)
+			subprocess.check_output([sys.executable, '-m', 'scripts', 'clean', '--region', 'sea_to_sky'], cwd=cwd, env=env)
+
+			self.assertEqual(sorted(os.listdir(os.path.join(root, 'data', 'cleaned'))), sorted(cleaned_filenames('sea_to_sky')))
+			self.assertEqual(os.listdir(cwd), [])
+
+	def test_render_writes_figures_outside_repo(self):
+		with tempfile.TemporaryDirectory() as root, tempfile.TemporaryDirectory() as cwd:
+			os.makedirs(os.path.join(root, 'figures'))
+			shutil.copytree(CLEANED_DATA_DIR, os.path.join(root, 'data', 'cleaned'))
+
+			env = dict(os.environ, AVALANCHE_CANADA_ROOT=root)
+			subprocess.check_output([sys.executable, '-m', 'scripts', 'render', 'sea_to_sky'], cwd=cwd, env=env)
+
+			self.assertEqual(sorted(os.listdir(os.path.join(root, 'figures'))),
+							 ['avalanche-danger-ratings-sea-to-sky-2011-2020.png',
+							  'frequency-of-avalanche-problem-types-sea-to-sky-2011-2020.png',
+							  'one-and-two-day-forecast-anomaly-sea-to-sky-2011-2020.png'])
+
+	def test_missing_region_reports_file(self):
+		for command in [['analyze', 'nowhere'], ['render', 'nowhere'], ['clean', '--region', 'nowhere']]:
+			stderr = io.StringIO()
+			with contextlib.redirect_stderr(stderr):
+				exit_code = cli.main(command)
+			self.assertEqual(exit_code, 1)
+			self.assertRegex(stderr.getvalue(), r'^\S+_nowhere_(CLEANED|RAW)\.csv: not found\n$')
+
+class TestIngest(unittest.TestCase):
+
+	def setUp(self):
+		self.source = tempfile.TemporaryDirectory()
+		self.raw = tempfile.TemporaryDirectory()
+		self.addCleanup(self.source.cleanup)
+		self.addCleanup(self.raw.cleanup)
+		patcher = mock.patch.object(cli, 'RAW_DATA_DIR', self.raw.name)
+		patcher.start()
+		self.addCleanup(patcher.stop)
+
+	def write(self, filename, header=RAW_HEADER):
+		path = os.path.join(self.source.name, filename)
+		with open(path, 'w') as f:
+			f.write(header + '2019-12-01,Low,1,Low,1,Low,1\n')
+		return path
+
+	def ingest(self, *paths):
+		stderr = io.StringIO()
+		with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(stderr):
+			exit_code = cli.main(['ingest'] + list(paths))
+		return exit_code, stderr.getvalue()
+
+	def test_valid_file_is_copied(self):
+		exit_code, _ = self.ingest(self.write('current_avalanche_conditions_sea_to_sky_RAW.csv'))
+		self.assertEqual(exit_code, 0)
+		self.assertEqual(os.listdir(self.raw.name), ['current_avalanche_conditions_sea_to_sky_RAW.csv'])
+
+	def test_bad_filenames_are_skipped(self):
+		exit_code, stderr = self.ingest(self.write('forecast_avalanche_conditions_sea_to_sky_RAW.csv'),
+										self.write('current_avalanche_conditions_sea_to_sky.csv'),
+										self.write('current_plus1_avalanche_conditions_sea_to_sky_RAW.csv'))
+		self.assertEqual(exit_code, 1)
+		self.assertEqual(stderr.count('filename does not match'), 2)
+		self.assertEqual(os.listdir(self.raw.name), ['current_plus1_avalanche_conditions_sea_to_sky_RAW.csv'])
+
+	def test_missing_columns_are_skipped(self):
+		exit_code, stderr = self.ingest(self.write('current_avalanche_conditions_sea_to_sky_RAW.csv', 'date_valid,alpine_status\n'))
+		self.assertEqual(exit_code, 1)
+		self.assertIn('missing columns alpine_status_code', stderr)
+		self.assertEqual(os.listdir(self.raw.name), [])
+
+	def test_unreadable_file_is_skipped(self):
+		missing = os.path.join(self.source.name, 'current_avalanche_conditions_sea_to_sky_RAW.csv')
+		exit_code, stderr = self.ingest(missing, self.write('current_plus2_avalanche_conditions_sea_to_sky_RAW.csv'))
+		self.assertEqual(exit_code, 1)
+		self.assertIn('could not read', stderr)
+		self.assertEqual(os.listdir(self.raw.name), ['current_plus2_avalanche_conditions_sea_to_sky_RAW.csv'])
+
+if __name__ == '__main__':
+	unittest.main()